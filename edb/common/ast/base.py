@@ -177,6 +177,13 @@ class MetaAST(type):
                         field_child_traverse, field_hidden, field_meta)
 
         cls._fields = fields
+        # Precomputed field initialization schedule used by
+        # AST.__init__ to avoid re-inspecting Field objects on
+        # every node instantiation.
+        cls._field_inits = tuple(
+            (field.name, field, field.default, callable(field.default))
+            for field in fields.values()
+        )
 
     def get_field(cls, name):
         return cls._fields.get(name)
@@ -193,14 +200,15 @@ class AST(object, metaclass=MetaAST):
                 f'{self.__class__.__name__!r}')
 
         should_check_types = __debug__ and _check_type is _check_type_real
-        for field_name, field in self.__class__._fields.items():
+        for field_name, field, default, default_is_factory in \
+                self.__class__._field_inits:
             if field_name in kwargs:
                 value = kwargs[field_name]
-            elif field.default is not None:
-                if callable(field.default):
-                    value = field.default()
+            elif default is not None:
+                if default_is_factory:
+                    value = default()
                 else:
-                    value = field.default
+                    value = default
             else:
                 value = None
 
@@ -129,14 +129,23 @@ class SimpleCounter:
 
 
 class AliasGenerator(SimpleCounter):
+    _hint_re = re.compile(r'~\d+$')
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._hint_cache: Dict[str, str] = {}
+
     def get(self, hint: str = '') -> str:
         if not hint:
             hint = 'v'
-        m = re.search(r'~\d+$', hint)
-        if m:
-            hint = hint[:m.start()]
 
-        idx = self.nextval(hint)
-        alias = f'{hint}~{idx}'
+        stripped = self._hint_cache.get(hint)
+        if stripped is None:
+            m = self._hint_re.search(hint)
+            stripped = hint[:m.start()] if m else hint
+            self._hint_cache[hint] = stripped
+
+        idx = self.nextval(stripped)
+        alias = f'{stripped}~{idx}'
 
         return alias
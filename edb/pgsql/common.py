@@ -185,6 +185,7 @@ def get_scalar_backend_name(id, module_id, catenate=True, *, aspect=None):
     return convert_name(name, aspect, catenate)
 
 
+@functools.lru_cache()
 def get_objtype_backend_name(id, module_id, *, catenate=True, aspect=None):
     if aspect is None:
         aspect = 'table'
@@ -203,6 +204,7 @@ def get_objtype_backend_name(id, module_id, *, catenate=True, aspect=None):
     return convert_name(name, suffix=suffix, catenate=catenate)
 
 
+@functools.lru_cache()
 def get_pointer_backend_name(id, module_id, *, catenate=False, aspect=None):
     if aspect is None:
         aspect = 'table'
@@ -311,7 +311,11 @@ def get_rvar_var(
 
     fieldref: pgast.OutputVar
 
-    if isinstance(var, pgast.TupleVarBase):
+    if isinstance(var, pgast.ColumnRef):
+        # Scalar outputs are the common case, so check for them first.
+        fieldref = get_column(rvar, var)
+
+    elif isinstance(var, pgast.TupleVarBase):
         elements = []
 
         for el in var.elements:
@@ -327,9 +331,6 @@ def get_rvar_var(
             typeref=var.typeref,
         )
 
-    elif isinstance(var, pgast.ColumnRef):
-        fieldref = get_column(rvar, var)
-
     else:
         raise AssertionError(f'unexpected OutputVar subclass: {var!r}')
 
@@ -25,6 +25,7 @@ from typing import *
 import collections
 import itertools
 import enum
+import uuid
 
 from edb.common import compiler
 
@@ -281,6 +282,14 @@ class Environment:
     explicit_top_cast: Optional[irast.TypeRef]
     singleton_mode: bool
     query_params: List[irast.Param]
+    type_table_name_cache: Dict[uuid.UUID, Tuple[str, str]]
+    ptr_table_name_cache: Dict[uuid.UUID, Tuple[str, str]]
+    ptr_union_cache: Dict[
+        irast.BasePointerRef,
+        Tuple[irast.BasePointerRef, ...],
+    ]
+    type_union_cache: Dict[irast.TypeRef, Tuple[irast.TypeRef, ...]]
+    ptr_cols_cache: Dict[irast.BasePointerRef, Tuple[str, str]]
 
     def __init__(
         self,
@@ -302,3 +311,8 @@ class Environment:
         self.singleton_mode = singleton_mode
         self.explicit_top_cast = explicit_top_cast
         self.query_params = query_params
+        self.type_table_name_cache = {}
+        self.ptr_table_name_cache = {}
+        self.ptr_union_cache = {}
+        self.type_union_cache = {}
+        self.ptr_cols_cache = {}
@@ -558,6 +558,10 @@ def put_path_rvar(
         stmt: pgast.Query, path_id: irast.PathId, rvar: pgast.PathRangeVar, *,
         aspect: str, env: context.Environment) -> None:
     assert isinstance(path_id, irast.PathId)
+    if stmt.path_rvar_map.get((path_id, aspect)) is rvar:
+        # Already recorded, and the path mask propagation
+        # below has been done.
+        return
     stmt.path_rvar_map[path_id, aspect] = rvar
 
     # Normally, masked paths (i.e paths that are only behind a fence below),
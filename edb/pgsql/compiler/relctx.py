@@ -42,6 +42,10 @@ from . import context
 from . import pathctx
 
 
+#: Modules whose backing tables live in the edgedbss schema.
+_SCHEMA_REDIRECT_MODULES = frozenset({'schema', 'cfg', 'sys'})
+
+
 def init_toplevel_query(
         ir_set: irast.Set, *,
         ctx: context.CompilerContextLevel) -> None:
@@ -709,12 +713,19 @@ def range_for_material_objtype(
     if typeref.material_type is not None:
         typeref = typeref.material_type
 
-    table_schema_name, table_name = common.get_objtype_backend_name(
-        typeref.id, typeref.module_id, catenate=False)
+    table_names = env.type_table_name_cache.get(typeref.id)
+    if table_names is None:
+        table_schema_name, table_name = common.get_objtype_backend_name(
+            typeref.id, typeref.module_id, catenate=False)
 
-    if typeref.name_hint.module in {'schema', 'cfg', 'sys'}:
-        # Redirect all queries to schema tables to edgedbss
-        table_schema_name = 'edgedbss'
+        if typeref.name_hint.module in _SCHEMA_REDIRECT_MODULES:
+            # Redirect all queries to schema tables to edgedbss
+            table_schema_name = 'edgedbss'
+
+        env.type_table_name_cache[typeref.id] = (
+            table_schema_name, table_name)
+    else:
+        table_schema_name, table_name = table_names
 
     relation = pgast.Relation(
         schemaname=table_schema_name,
@@ -731,12 +742,16 @@ def range_for_material_objtype(
         )
     )
 
-    overlays = get_type_rel_overlays(typeref, dml_source=dml_source, ctx=ctx)
-    if overlays and include_overlays:
+    overlays = (
+        get_type_rel_overlays(typeref, dml_source=dml_source, ctx=ctx)
+        if include_overlays else None
+    )
+    if overlays:
         set_ops = []
 
-        qry = pgast.SelectStmt()
-        qry.from_clause.append(rvar)
+        qry = pgast.SelectStmt(
+            from_clause=[rvar],
+        )
         pathctx.put_path_value_rvar(qry, path_id, rvar, env=env)
         if path_id.is_objtype_path():
             pathctx.put_path_source_rvar(qry, path_id, rvar, env=env)
@@ -789,6 +804,19 @@ def range_for_material_objtype(
     return rvar
 
 
+def _union_elements(
+        typeref: irast.TypeRef, *,
+        ctx: context.CompilerContextLevel) -> Tuple[irast.TypeRef, ...]:
+    union = ctx.env.type_union_cache.get(typeref)
+    if union is None:
+        # Order the elements by name to make the resulting
+        # query deterministic.
+        union = tuple(
+            sorted(typeref.union, key=lambda t: t.name_hint))
+        ctx.env.type_union_cache[typeref] = union
+    return union
+
+
 def range_for_typeref(
         typeref: irast.TypeRef,
         path_id: irast.PathId, *,
@@ -808,18 +836,50 @@ def range_for_typeref(
             ctx=ctx,
         )
 
+    elif typeref.union and len(typeref.union) == 1:
+        # A union of one element is equivalent to that element,
+        # so skip the set-op scaffolding entirely.
+        rvar = range_for_typeref(
+            next(iter(typeref.union)),
+            path_id=path_id,
+            include_overlays=include_overlays,
+            include_descendants=not typeref.union_is_concrete,
+            dml_source=dml_source,
+            ctx=ctx,
+        )
+
     elif typeref.union:
         # Union object types are represented as a UNION of selects
         # from their children, which is, for most purposes, equivalent
         # to SELECTing from a parent table.
         set_ops = []
 
-        for child in typeref.union:
+        env = ctx.env
+        is_objtype_path = path_id.is_objtype_path()
+
+        # Process the union elements with an explicit worklist,
+        # flattening any nested unions into the same branch list
+        # instead of wrapping each of them in a subselect of its own.
+        worklist = [
+            (child, not typeref.union_is_concrete)
+            for child in reversed(_union_elements(typeref, ctx=ctx))
+        ]
+
+        while worklist:
+            child, include_child_descendants = worklist.pop()
+
+            if child.union:
+                worklist.extend(
+                    (sub, not child.union_is_concrete)
+                    for sub in reversed(_union_elements(child, ctx=ctx))
+                )
+                continue
+
             c_rvar = range_for_typeref(
                 child,
                 path_id=path_id,
                 include_overlays=include_overlays,
-                include_descendants=not typeref.union_is_concrete,
+                include_descendants=include_child_descendants,
                 dml_source=dml_source,
                 ctx=ctx,
             )
@@ -828,9 +888,9 @@ def range_for_typeref(
                 from_clause=[c_rvar],
             )
 
-            pathctx.put_path_value_rvar(qry, path_id, c_rvar, env=ctx.env)
-            if path_id.is_objtype_path():
-                pathctx.put_path_source_rvar(qry, path_id, c_rvar, env=ctx.env)
+            pathctx.put_path_value_rvar(qry, path_id, c_rvar, env=env)
+            if is_objtype_path:
+                pathctx.put_path_source_rvar(qry, path_id, c_rvar, env=env)
 
             pathctx.put_path_bond(qry, path_id)
 
@@ -862,20 +922,17 @@ def range_from_queryset(
 
     if len(set_ops) > 1:
         # More than one class table, generate a UNION/EXCEPT clause.
-        qry = pgast.SelectStmt(
-            all=True,
-            larg=set_ops[0][1]
-        )
-
+        qry = set_ops[0][1]
         for op, rarg in set_ops[1:]:
-            qry.op, qry.rarg = op, rarg
             qry = pgast.SelectStmt(
+                op=op,
                 all=True,
-                larg=qry
+                larg=qry,
+                rarg=rarg,
             )
 
         rvar = pgast.RangeSubselect(
-            subquery=qry.larg,
+            subquery=qry,
             alias=pgast.Alias(
                 aliasname=ctx.env.aliases.get(objname.name),
             )
@@ -895,12 +952,19 @@ def table_from_ptrref(
         include_descendants: bool = True,
         ctx: context.CompilerContextLevel) -> pgast.RelRangeVar:
     """Return a Table corresponding to a given Link."""
-    table_schema_name, table_name = common.get_pointer_backend_name(
-        ptrref.id, ptrref.module_id, catenate=False)
+    table_names = ctx.env.ptr_table_name_cache.get(ptrref.id)
+    if table_names is None:
+        table_schema_name, table_name = common.get_pointer_backend_name(
+            ptrref.id, ptrref.module_id, catenate=False)
+
+        if ptrref.name.module in _SCHEMA_REDIRECT_MODULES:
+            # Redirect all queries to schema tables to edgedbss
+            table_schema_name = 'edgedbss'
 
-    if ptrref.name.module in {'schema', 'cfg', 'sys'}:
-        # Redirect all queries to schema tables to edgedbss
-        table_schema_name = 'edgedbss'
+        ctx.env.ptr_table_name_cache[ptrref.id] = (
+            table_schema_name, table_name)
+    else:
+        table_schema_name, table_name = table_names
 
     relation = pgast.Relation(
         schemaname=table_schema_name, name=table_name)
@@ -931,24 +995,32 @@ def range_for_ptrref(
     corresponding to a set of specialized links computed from the given
     `ptrref` taking source inheritance into account.
     """
-    tgt_col = pg_types.get_ptrref_storage_info(
-        ptrref, resolve_type=False, link_bias=True).column_name
-
-    cols = [
-        'source',
-        tgt_col
-    ]
+    cols = ctx.env.ptr_cols_cache.get(ptrref)
+    if cols is None:
+        tgt_col = pg_types.get_ptrref_storage_info(
+            ptrref, resolve_type=False, link_bias=True).column_name
+        cols = ('source', tgt_col)
+        ctx.env.ptr_cols_cache[ptrref] = cols
 
     set_ops = []
 
     if ptrref.union_components:
-        refs = ptrref.union_components
+        refs = ctx.env.ptr_union_cache.get(ptrref)
+        if refs is None:
+            # Order the components by name to make the resulting
+            # query deterministic.
+            refs = tuple(
+                sorted(ptrref.union_components, key=lambda p: p.name))
+            ctx.env.ptr_union_cache[ptrref] = refs
         if only_self and len(refs) > 1:
             raise errors.InternalServerError(
                 'unexpected union link'
             )
     else:
-        refs = {ptrref}
+        refs = (ptrref,)
+
+    seen_union_overlays: Set[
+        Union[pgast.BaseRelation, pgast.CommonTableExpr]] = set()
 
     for src_ptrref in refs:
         assert isinstance(src_ptrref, irast.PointerRef), \
@@ -959,22 +1031,39 @@ def range_for_ptrref(
             ctx=ctx,
         )
 
-        qry = pgast.SelectStmt()
-        qry.from_clause.append(table)
+        table_alias = table.alias.aliasname
 
-        # Make sure all property references are pulled up properly
-        for colname in cols:
-            selexpr = pgast.ColumnRef(
-                name=[table.alias.aliasname, colname])
-            qry.target_list.append(
-                pgast.ResTarget(val=selexpr, name=colname))
+        qry = pgast.SelectStmt(
+            from_clause=[table],
+            # Make sure all property references are pulled up properly
+            target_list=[
+                pgast.ResTarget(
+                    val=pgast.ColumnRef(name=[table_alias, colname]),
+                    name=colname,
+                )
+                for colname in cols
+            ],
+        )
 
         set_ops.append(('union', qry))
 
-        overlays = get_ptr_rel_overlays(
-            src_ptrref, dml_source=dml_source, ctx=ctx)
-        if overlays and include_overlays:
+        if include_overlays:
+            overlays = get_ptr_rel_overlays(
+                src_ptrref, dml_source=dml_source, ctx=ctx)
             for op, cte in overlays:
+                if op == 'union':
+                    # Overlays are keyed by pointer short name, so
+                    # sibling components of a union link may resolve
+                    # to the same overlay list; including the same
+                    # relation more than once would duplicate rows
+                    # under UNION ALL.  Only UNION branches may be
+                    # skipped, though: an EXCEPT branch must be
+                    # re-applied after each component's base scan
+                    # for the subtraction to cover all components.
+                    if cte in seen_union_overlays:
+                        continue
+                    seen_union_overlays.add(cte)
+
                 rvar = pgast.RelRangeVar(
                     relation=cte,
                     alias=pgast.Alias(
@@ -1078,7 +1167,9 @@ def get_type_rel_overlays(
     if typeref.material_type is not None:
         typeref = typeref.material_type
 
-    return ctx.type_rel_overlays[str(typeref.id), dml_source]
+    # Use a non-mutating lookup here, so that misses do not
+    # pollute the overlay map with empty entries.
+    return ctx.type_rel_overlays.get((str(typeref.id), dml_source), [])
 
 
 def add_ptr_rel_overlay(
@@ -1107,4 +1198,6 @@ def get_ptr_rel_overlays(
         Union[pgast.BaseRelation, pgast.CommonTableExpr],
     ]
 ]:
-    return ctx.ptr_rel_overlays[ptrref.shortname, dml_source]
+    # Use a non-mutating lookup here, so that misses do not
+    # pollute the overlay map with empty entries.
+    return ctx.ptr_rel_overlays.get((ptrref.shortname, dml_source), [])
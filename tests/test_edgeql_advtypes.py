@@ -72,6 +72,43 @@ class TestEdgeQLAdvancedTypes(tb.QueryTestCase):
             }]
         )
 
+    async def test_edgeql_advtypes_overlapping_link_union_subtract(self):
+        await self.con.execute("""
+            INSERT A { name := 'a2' };
+            INSERT A { name := 'a3' };
+            INSERT V {
+                name := 'v2',
+                s := 's2',
+                t := 't2',
+                u := 'u2',
+                l_a := (SELECT A FILTER .name IN {'a2', 'a3'}),
+            };
+        """)
+
+        # The link removal must be reflected in both components
+        # of the union link (S.l_a and T.l_a).
+        await self.assert_query_result(
+            r"""
+            WITH
+                U := (
+                    UPDATE V
+                    FILTER .name = 'v2'
+                    SET {
+                        l_a -= (SELECT A FILTER .name = 'a2')
+                    }
+                )
+            SELECT (DISTINCT (SELECT S UNION T)) {
+                name,
+                l_a: { name } ORDER BY .name,
+            }
+            FILTER .name = U.name
+            """,
+            [{
+                'name': 'v2',
+                'l_a': [{'name': 'a3'}],
+            }]
+        )
+
     async def _setup_basic_data(self):
         await self.con.execute("""
             INSERT CBa {ba := 'cba0'};